@@ -1,9 +1,16 @@
+import errno
+import operator
+import os
+import stat
+import sys
 import threading
-from queue import Queue
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 from enum import Enum
-import datetime
+import time
 
 
 class Unit(Enum):
@@ -13,8 +20,393 @@ class Unit(Enum):
     GIGABYTE = 4
 
 
+_COMPRESSION_RATIOS = {'.txt': 0.5,
+                       '.csv': 0.7, '.jpg': 0.9, '.pdf': 0.8}
+
+# Errors for which Path.exists() and Path.is_dir() report the path as missing instead of raising
+_MISSING_ERRNOS = frozenset((errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP))
+
+# Number of files a worker thread processes between progress bar updates and looks at the other threads' totals
+_BATCH_SIZE = 1024
+
+# Upper bound on the number of file rows the shared scan cache holds across all of its entries,
+# which keeps its memory use proportional to a single large scan
+_SCAN_CACHE_MAX_FILES = 1_000_000
+
+# os.fwalk and dir_fd-relative stat() are only available on POSIX platforms
+_HAS_FWALK = hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd
+
+
+def _get_extension(name):
+    """
+    Returns the lowercased extension of a file name, as Path.suffix would.
+
+    Args:
+        name (str): The file name.
+
+    Returns:
+        str: The extension including the leading dot, or an empty string if there is none.
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
+
+def _get_suffixes(extensions):
+    """
+    Normalizes a list of file extensions into a tuple of lowercased suffixes for str.endswith.
+
+    Args:
+        extensions (list of str): File extensions, with or without the leading dot.
+
+    Returns:
+        tuple of str: The lowercased extensions, each with a leading dot.
+    """
+    return tuple(ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in extensions)
+
+
+def _make_name_filter(suffixes, excluded):
+    """
+    Builds a predicate matching file names against included and excluded extensions.
+
+    Args:
+        suffixes (tuple of str): Lowercased extensions to include. Every extension is included if empty.
+        excluded (tuple of str): Lowercased extensions to exclude.
+
+    Returns:
+        callable: A function taking a file name and returning whether it matches, or None if nothing is filtered.
+    """
+    if not suffixes and not excluded:
+        return None
+
+    def accept(name):
+        lower_name = name.lower()
+        if suffixes and not lower_name.endswith(suffixes):
+            return False
+        return not (excluded and lower_name.endswith(excluded))
+
+    return accept
+
+
+def _scandir(top, include_hidden=True, accept=None):
+    """
+    Scans a single directory with os.scandir, without descending into its subdirectories.
+
+    Args:
+        top (str): The path to the directory to scan.
+        include_hidden (bool): Whether or not to include entries whose name starts with a dot.
+        accept (callable): A predicate on file names, checked before a file is stat()ed. Files it
+                           rejects are skipped.
+
+    Yields:
+        tuple of (str, str, os.stat_result): The directory, name and stat result of each regular file found.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = [entry for entry in it
+                       if (include_hidden or entry.name[0] != '.')
+                       and (accept is None or accept(entry.name))
+                       and entry.is_file(follow_symlinks=False)]
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        yield top, entry.name, st
+
+
+def _fwalk(top, include_hidden=True, accept=None):
+    """
+    Walks a directory tree with os.fwalk, stat()ing each file relative to its open directory fd.
+
+    Args:
+        top (str): The path to the directory to walk.
+        include_hidden (bool): Whether or not to include entries whose name starts with a dot. Hidden
+                               directories are not descended into when this is False.
+        accept (callable): A predicate on file names, checked before a file is stat()ed. Files it
+                           rejects are skipped.
+
+    Yields:
+        tuple of (str, str, os.stat_result): The directory, name and stat result of each regular file found.
+    """
+    # Bound once, as the loop below runs for every file in the tree
+    stat_at = os.stat
+    is_regular = stat.S_ISREG
+    # os.fwalk() yields nothing for a symlinked root, so walk its target and report the paths under top
+    root = os.path.realpath(top) if os.path.islink(top) else top
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(root):
+        if root is not top:
+            dirpath = top + dirpath[len(root):]
+        if not include_hidden:
+            dirnames[:] = [name for name in dirnames if name[0] != '.']
+            filenames = [name for name in filenames if name[0] != '.']
+        if accept is not None:
+            filenames = [name for name in filenames if accept(name)]
+        for name in filenames:
+            try:
+                st = stat_at(name, dir_fd=dirfd, follow_symlinks=False)
+            except OSError:
+                continue
+            if is_regular(st.st_mode):
+                yield dirpath, name, st
+
+
+def _walk(top, threads=16, include_hidden=True, accept=None):
+    """
+    Walks a directory tree with a pool of threads scanning directories in parallel.
+
+    Worker threads pop directories off a shared LIFO list, scan them with os.scandir, push the
+    subdirectories they find back onto the list and hand the files they find to the caller.
+
+    Args:
+        top (str): The path to the directory to walk.
+        threads (int): The number of threads to scan directories with.
+        include_hidden (bool): Whether or not to include entries whose name starts with a dot. Hidden
+                               directories are not descended into when this is False.
+        accept (callable): A predicate on file names, checked before a file is stat()ed. Files it
+                           rejects are skipped.
+
+    Yields:
+        tuple of (str, str, os.stat_result): The directory, name and stat result of each regular file found.
+
+    Raises:
+        Exception: Any unexpected error raised by a worker thread, once every worker has stopped.
+    """
+    lock = threading.Lock()
+    on_input = threading.Condition(lock)
+    on_output = threading.Condition(lock)
+    state = {'tasks': 1, 'error': None}
+    paths = [top]
+    output = deque()
+
+    def scan():
+        while True:
+            with lock:
+                while True:
+                    if state['error'] is not None or not state['tasks']:
+                        output.append(None)
+                        on_output.notify()
+                        return
+                    if paths:
+                        path = paths.pop()
+                        break
+                    on_input.wait()
+
+            files = []
+            dirs = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if not include_hidden and entry.name[0] == '.':
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        elif accept is not None and not accept(entry.name):
+                            continue
+                        elif entry.is_file(follow_symlinks=False):
+                            try:
+                                st = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                # The file vanished or cannot be stat()ed, skip just this one
+                                continue
+                            files.append((path, entry.name, st))
+            except OSError:
+                pass
+
+            with lock:
+                if files:
+                    output.append(files)
+                    on_output.notify()
+                paths.extend(dirs)
+                state['tasks'] += len(dirs) - 1
+                on_input.notify_all()
+
+    def worker():
+        try:
+            scan()
+        except BaseException as error:
+            # Stop the other workers too, the caller re-raises the error once they are done
+            with lock:
+                if state['error'] is None:
+                    state['error'] = error
+                output.append(None)
+                on_output.notify()
+                on_input.notify_all()
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(max(threads, 1))]
+    for thread in workers:
+        thread.start()
+
+    finished = 0
+    while finished < len(workers):
+        with lock:
+            while not output:
+                on_output.wait()
+            batch = output.popleft()
+        if batch is None:
+            finished += 1
+        elif state['error'] is None:
+            yield from batch
+
+    for thread in workers:
+        thread.join()
+    if state['error'] is not None:
+        raise state['error']
+
+
+class _PathTable:
+    """
+    Compact storage for many file paths, kept as interned names referencing a shared table of parent directories.
+    """
+    __slots__ = ('parents', 'names', 'dirs', 'dir_id')
+
+    def __init__(self):
+        self.parents = []
+        self.names = []
+        self.dirs = []
+        self.dir_id = {}
+
+    def add(self, dirpath, name):
+        """
+        Adds a path to the table.
+
+        Args:
+            dirpath (str): The directory the file is in.
+            name (str): The name of the file.
+
+        Returns:
+            int: The index of the path, to be passed to render().
+        """
+        parent = self.dir_id.get(dirpath)
+        if parent is None:
+            parent = self.dir_id[dirpath] = len(self.dirs)
+            self.dirs.append(dirpath)
+        self.parents.append(parent)
+        self.names.append(sys.intern(name))
+        return len(self.names) - 1
+
+    def render(self, idx):
+        """
+        Returns the full path stored at an index.
+
+        Args:
+            idx (int): The index returned by add().
+
+        Returns:
+            str: The full path.
+        """
+        return os.path.join(self.dirs[self.parents[idx]], self.names[idx])
+
+
+def _iter_files(path, path_table=None, accept=None, include_hidden=True, num_threads=1, top_level_only=False):
+    """
+    Lazily yields the files under a path, applying every filter in a single pass.
+
+    Args:
+        path (str): The path to the directory or file to scan.
+        path_table (_PathTable): The table to store the paths of the files in, or None to not keep them.
+        accept (callable): A predicate on file names, checked before a file is stat()ed.
+        include_hidden (bool): Whether or not to include entries whose name starts with a dot.
+        num_threads (int): The number of threads to use for walking the directory tree.
+        top_level_only (bool): Whether or not to only yield the files directly inside the directory.
+
+    Yields:
+        tuple of (int, str, int): The path_table index (None without a table), lowercased extension and
+                                  size in bytes of each file.
+    """
+    keep_paths = path_table is not None
+    # (st_dev, st_ino) of every multiply-linked file seen so far, so hard links are counted once
+    seen_inodes = set()
+    if os.path.isdir(path):
+        if top_level_only:
+            walk = _scandir(path, include_hidden=include_hidden, accept=accept)
+        elif _HAS_FWALK and num_threads <= 1:
+            walk = _fwalk(path, include_hidden=include_hidden, accept=accept)
+        else:
+            walk = _walk(path, threads=num_threads, include_hidden=include_hidden, accept=accept)
+        # Bound once, as the loop below runs for every file in the tree
+        add_path = path_table.add if keep_paths else None
+        intern = sys.intern
+        get_extension = _get_extension
+        for dirpath, name, st in walk:
+            if st.st_nlink > 1:
+                inode = (st.st_dev, st.st_ino)
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+            yield add_path(dirpath, name) if keep_paths else None, intern(get_extension(name)), st.st_size
+    elif not top_level_only and os.path.isfile(path):
+        dirpath, name = os.path.split(path)
+        yield path_table.add(dirpath, name) if keep_paths else None, _get_extension(name), os.stat(path).st_size
+
+
+# Maps (path, exts, excl, include_hidden, top_level_only, keep_paths) to (fingerprint, path_table, files),
+# least recently used first
+_scan_cache = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+def _scan_cached(path, exts, excl, include_hidden, top_level_only, fingerprint, keep_paths=False, num_threads=1):
+    """
+    Scans a path with _iter_files, sharing the result across calculator instances.
+
+    A cached scan is reused while the path's fingerprint is unchanged. The fingerprint only covers the
+    top-level directory's own entries, so files that change deeper in the tree, or change size in place,
+    are not noticed until clear_cache() is called. The cache holds at most _SCAN_CACHE_MAX_FILES file
+    rows in total, evicting the least recently used scans first.
+
+    Args:
+        path (str): The path to the directory or file to scan.
+        exts (tuple of str): Lowercased extensions to include. Every extension is included if empty.
+        excl (tuple of str): Lowercased extensions to exclude.
+        include_hidden (bool): Whether or not to include entries whose name starts with a dot.
+        top_level_only (bool): Whether or not to only return the files directly inside the directory.
+        fingerprint (tuple of (int, int)): The fingerprint of the path, so that changes to it miss the cache.
+        keep_paths (bool): Whether or not to keep the paths of the files in a _PathTable.
+        num_threads (int): The number of threads to use for walking the directory tree.
+
+    Returns:
+        tuple of (_PathTable, tuple of (int, str, int)): The table holding the paths of the files (None
+                                                         without keep_paths), and the path_table index,
+                                                         lowercased extension and size in bytes of each file.
+    """
+    key = (path, exts, excl, include_hidden, top_level_only, keep_paths)
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _scan_cache.move_to_end(key)
+            return cached[1], cached[2]
+        # The path changed since it was cached, so the old scan can never be hit again
+        _scan_cache.pop(key, None)
+
+    path_table = _PathTable() if keep_paths else None
+    files = tuple(_iter_files(path, path_table, _make_name_filter(exts, excl), include_hidden,
+                              num_threads, top_level_only))
+    if len(files) <= _SCAN_CACHE_MAX_FILES:
+        with _scan_cache_lock:
+            _scan_cache[key] = (fingerprint, path_table, files)
+            cached_files = sum(len(entry[2]) for entry in _scan_cache.values())
+            while cached_files > _SCAN_CACHE_MAX_FILES:
+                _, evicted = _scan_cache.popitem(last=False)
+                cached_files -= len(evicted[2])
+    return path_table, files
+
+
+def clear_cache():
+    """
+    Clears the process-wide cache of directory scans shared by DirectorySizeCalculator objects created
+    with share_cache=True.
+    """
+    with _scan_cache_lock:
+        _scan_cache.clear()
+
+
 class DirectorySizeCalculator:
-    def __init__(self, path='.', file_types=None, exclude=None, max_size=None, include_hidden_files=False, sort_by=None):
+    def __init__(self, path='.', file_types=None, exclude=None, max_size=None, include_hidden_files=False, sort_by=None,
+                 share_cache=False):
         """
         Initializes a DirectorySizeCalculator object.
 
@@ -25,42 +417,77 @@ class DirectorySizeCalculator:
             max_size (int): The maximum size of the directory to calculate, in bytes.
             include_hidden_files (bool): Whether or not to include hidden files in the size calculation.
             sort_by (str): The sorting method to use when processing files. Valid values are 'size' and 'name'.
+            share_cache (bool): Whether or not to reuse scans cached by other instances. Cached scans only
+                                notice changes to the top-level directory's own entries, see clear_cache().
         """
         self.path = Path(path)
         self.file_types = file_types or []
         self.exclude = exclude or []
+        # Maps (path, top_level_only) to (total_size, dir_mtime_ns, dir_nlink)
         self.cache = {}
         self.include_hidden_files = include_hidden_files
         self.sort_by = sort_by
+        self.share_cache = share_cache
+        # Resolved once here rather than on every scan
+        self._path_str = str(self.path)
+        self._exts = _get_suffixes(self.file_types)
+        self._excl = _get_suffixes(self.exclude)
 
-    def _get_files(self):
+    def _get_files(self, fingerprint, num_threads=1, top_level_only=False):
         """
-        Returns a list of files to be processed.
+        Returns the files to be processed.
+
+        With share_cache set, a previous scan of the same path with the same filters is reused. Otherwise,
+        and unless the files have to be sorted, they are yielded lazily as the directory is walked.
+
+        Args:
+            fingerprint (tuple of (int, int)): The fingerprint of the path, as returned by _get_fingerprint().
+            num_threads (int): The number of threads to use for walking the directory tree.
+            top_level_only (bool): Whether or not to only return the files directly inside the directory.
 
         Returns:
-            list of Path: A list of file paths.
+            iterable of (int, str, int): The path_table index (None unless sorting by name), lowercased
+                                         extension and size in bytes of each file.
         """
-        files = []
-        if self.path.is_dir():
-            for file_ in self.path.rglob('*'):
-                if not self.include_hidden_files and file_.name.startswith('.'):
-                    continue
-                file_ext = file_.suffix.lower()
-                if self.file_types and file_ext not in self.file_types:
-                    continue
-                if self.exclude and file_ext in self.exclude:
-                    continue
-                files.append(file_)
-        elif self.path.is_file() and self.path.exists():
-            files.append(self.path)
+        if fingerprint is None:
+            return []
+        # Paths are only kept when they are needed to sort by name
+        keep_paths = self.sort_by == 'name'
+        if self.share_cache:
+            path_table, files = _scan_cached(self._path_str, self._exts, self._excl, self.include_hidden_files,
+                                             top_level_only, fingerprint, keep_paths, num_threads)
+        else:
+            path_table = _PathTable() if keep_paths else None
+            files = _iter_files(self._path_str, path_table, _make_name_filter(self._exts, self._excl),
+                                self.include_hidden_files, num_threads, top_level_only)
 
+        # sorted() leaves cached rows, which other instances share, in their original order
         if self.sort_by == 'size':
-            files.sort(key=lambda file_: file_.stat().st_size)
+            files = sorted(files, key=operator.itemgetter(2))
         elif self.sort_by == 'name':
-            files.sort()
+            files = sorted(files, key=lambda file_: path_table.render(file_[0]))
 
         return files
 
+    def _get_fingerprint(self):
+        """
+        Returns a cheap fingerprint of the top-level directory, used to invalidate cached sizes.
+
+        Only changes to the top-level directory's own entries alter the fingerprint, so edits deeper
+        in the tree are not detected.
+
+        Returns:
+            tuple of (int, int): The modification time in nanoseconds and link count of the path,
+                                 or None if it does not exist or cannot be resolved.
+        """
+        try:
+            st = self.path.stat()
+        except OSError as error:
+            if error.errno not in _MISSING_ERRNOS:
+                raise
+            return None
+        return st.st_mtime_ns, st.st_nlink
+
     def _get_compression_ratio(self, file_ext):
         """
         Returns the compression ratio for a given file extension.
@@ -71,9 +498,7 @@ class DirectorySizeCalculator:
         Returns:
             float: The compression ratio for the file extension.
         """
-        compression_ratios = {'.txt': 0.5,
-                              '.csv': 0.7, '.jpg': 0.9, '.pdf': 0.8}
-        return compression_ratios.get(file_ext, 1.0)
+        return _COMPRESSION_RATIOS.get(file_ext, 1.0)
 
     def generate_report(self, num_files_processed, total_size, time_taken):
         """
@@ -112,76 +537,96 @@ class DirectorySizeCalculator:
         Returns:
             float: The size of the directory, in the specified unit.
         """
-        start_time = datetime.datetime.now()
-        files = self._get_files()
-        # Check if the size has already been calculated and stored in the cache
-        if str(self.path) in self.cache:
-            size = self.cache[str(self.path)]
-            return self._format_size(size, unit)
-
-        size = 0
-        compressed_size = 0
-        file_queue = Queue()
-        if top_level_only:
-            for file_ in self.path.glob('*'):
-                if file_.is_file():
-                    file_ext = file_.suffix.lower()
-                    if self.file_types and file_ext not in self.file_types:
-                        continue
-                    if self.exclude and file_ext in self.exclude:
-                        continue
-                    file_queue.put(file_)
-        else:
-            files = self._get_files()
-            for file_ in files:
-                file_queue.put(file_)
+        start_time = time.perf_counter()
+        # ThreadPoolExecutor and the strided chunking both need at least one thread
+        num_threads = max(num_threads, 1)
+        # Check if the size has already been calculated and the directory is unchanged since
+        cache_key = (self._path_str, top_level_only)
+        fingerprint = self._get_fingerprint()
+        cached = self.cache.get(cache_key)
+        if cached is not None and fingerprint is not None and cached[1:] == fingerprint:
+            return self._format_size(cached[0], unit)
+
+        stop = threading.Event()
+        files = self._get_files(fingerprint, num_threads, top_level_only)
+
+        # Collect flat size and compression ratio columns straight from the rows, so chunks can be
+        # summed in C rather than one file at a time. Unsorted scans never hold a list of rows.
+        sizes = array('q')
+        ratios = array('d')
+        add_size = sizes.append
+        add_ratio = ratios.append
+        ratio_by_ext = {}
+        for _, file_ext, file_size in files:
+            compression_ratio = ratio_by_ext.get(file_ext)
+            if compression_ratio is None:
+                compression_ratio = ratio_by_ext[file_ext] = self._get_compression_ratio(file_ext)
+            add_size(file_size)
+            add_ratio(compression_ratio)
+        del files
 
         # Create a tqdm progress bar object
-        file_count = file_queue.qsize()
+        file_count = len(sizes)
         progress_bar = tqdm(
-            total=file_count, desc='Calculating directory size')
-
-        def worker():
-            nonlocal size, compressed_size
-            while True:
-                try:
-                    file_ = file_queue.get_nowait()
-                except:
-                    break
-                file_size = file_.stat().st_size
-                compression_ratio = self._get_compression_ratio(
-                    file_.suffix.lower())
-                compressed_size += file_size * compression_ratio
-                if max_size and compressed_size > max_size:
+            total=file_count, desc='Calculating directory size',
+            mininterval=0.2, disable=not sys.stderr.isatty())
+
+        # Each thread accumulates its chunk into its own [size, compressed_size] pair,
+        # the pairs are only combined once every chunk has been processed. The chunks
+        # are strided views of the columns rather than copies.
+        local_totals = [[0, 0] for _ in range(num_threads)]
+        chunks = [(memoryview(sizes)[i::num_threads], memoryview(ratios)[i::num_threads])
+                  for i in range(num_threads)]
+
+        def chunk_total(idx):
+            local = local_totals[idx]
+            chunk_sizes, chunk_ratios = chunks[idx]
+            if not max_size:
+                local[0] = sum(chunk_sizes)
+                local[1] = sum(map(operator.mul, chunk_sizes, chunk_ratios))
+                progress_bar.update(len(chunk_sizes))
+                return local
+
+            processed = 0
+            for file_size, compression_ratio in zip(chunk_sizes, chunk_ratios):
+                local[1] += file_size * compression_ratio
+                if local[1] > max_size:
                     # If the size exceeds the limit, stop calculating and return the current size
-                    return
-                size += file_size
-                progress_bar.update(1)
-
-        threads = []
-        for i in range(num_threads):
-            thread = threading.Thread(target=worker)
-            thread.start()
-            threads.append(thread)
+                    stop.set()
+                    break
+                local[0] += file_size
+                processed += 1
+                if processed == _BATCH_SIZE:
+                    progress_bar.update(processed)
+                    processed = 0
+                    # The combined total of all threads is only looked at once per batch
+                    if stop.is_set() or sum(total[1] for total in local_totals) > max_size:
+                        stop.set()
+                        break
+            progress_bar.update(processed)
+            return local
 
         # Start the progress bar
         progress_bar.set_postfix_str(f'Threads: {num_threads}')
 
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            totals = list(executor.map(chunk_total, range(num_threads)))
+
+        size = sum(total[0] for total in totals)
+        compressed_size = sum(total[1] for total in totals)
 
         # Close the progress bar
         progress_bar.close()
 
-        end_time = datetime.datetime.now()
-        time_taken = (end_time - start_time).total_seconds()
+        time_taken = time.perf_counter() - start_time
 
-        # Store the calculated size in the cache
-        self.cache[str(self.path)] = size
+        # Store the calculated size in the cache, unless max_size cut the calculation short
+        if fingerprint is not None and not stop.is_set():
+            self.cache[cache_key] = (compressed_size,) + fingerprint
 
         # Generate and print the report
-        report = self.generate_report(num_files_processed=len(
-            files), total_size=size, time_taken=time_taken)
+        report = self.generate_report(num_files_processed=file_count,
+                                      total_size=size, time_taken=time_taken)
         print(report)
 
         return self._format_size(compressed_size, unit)
@@ -207,7 +652,8 @@ class DirectorySizeCalculator:
             return size / (1024 * 1024 * 1024)
 
 
-def calculate_directory_size(path='.', file_types=None, exclude=None, num_threads=1, unit=Unit.BYTE, sort_by=None):
+def calculate_directory_size(path='.', file_types=None, exclude=None, num_threads=1, unit=Unit.BYTE, sort_by=None,
+                             share_cache=False):
     """
     Calculates the total size of all files in a given directory.
 
@@ -219,12 +665,14 @@ def calculate_directory_size(path='.', file_types=None, exclude=None, num_thread
         unit (Unit, optional): The unit of measurement to use for the size calculation. Default is Unit.BYTE.
         sort_by (str or SortBy, optional): The attribute by which to sort the directory contents before calculating their size.
                                            Default is None, which means no sorting is performed.
+        share_cache (bool, optional): Whether or not to reuse a scan cached by an earlier call with share_cache=True.
+                                      Default is False, which always rescans the directory.
 
     Returns:
         The total size of all files in the directory, in the specified unit of measurement.
     """
     calculator = DirectorySizeCalculator(
-        path=path, file_types=file_types, exclude=exclude, sort_by=sort_by)
+        path=path, file_types=file_types, exclude=exclude, sort_by=sort_by, share_cache=share_cache)
     return calculator.get_size(num_threads=num_threads, unit=unit)
 
 